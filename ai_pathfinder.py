@@ -1,8 +1,20 @@
+import ast
+import hashlib
+import warnings
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.animation import FuncAnimation
-from collections import deque
-import heapq
+from matplotlib.colors import ListedColormap, NoNorm
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:             # numba is optional: kernels then run as Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 
 # ── Grid Configuration ─────────────────────────────────────────────────────────
@@ -13,7 +25,7 @@ GOAL  = (8, 8)
 
 # Strict clockwise movement order (as required):
 # 1. Up  2. Right  3. Bottom  4. Bottom-Right (diagonal)  5. Left  6. Top-Left (diagonal)
-DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (1, 1), (0, -1), (-1, -1)]
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (1, 1), (0, -1), (-1, -1))
 
 # Static walls — fixed, never change
 STATIC_WALLS = {
@@ -41,240 +53,625 @@ def build_grid():
         'cols':  COLS,
         'start': START,
         'goal':  GOAL,
-        'walls': set(STATIC_WALLS),
+        'wall_bits': STATIC_WALL_BITS,
+        'occupancy': STATIC_OCCUPANCY,
+        'neighbors': NEIGHBORS,
+        'neighbor_costs': NEIGHBOR_COSTS,
     }
 
 
-def is_valid(grid, pos):
-    r, c = pos
-    if r < 0 or r >= grid['rows'] or c < 0 or c >= grid['cols']:
-        return False
-    if pos in grid['walls']:
-        return False
-    return True
+def build_neighbor_table(occupancy):
+    """Precompute each cell's valid neighbours in the clockwise move order.
+
+    Row i holds the linear indices of cell i's neighbours padded with -1,
+    plus their step costs. Walls are static, so this is done once per grid.
+    """
+    rows, cols = occupancy.shape
+    neighbors = np.full((rows * cols, len(DIRECTIONS)), -1, np.int32)
+    costs     = np.zeros((rows * cols, len(DIRECTIONS)))
+    for r in range(rows):
+        for c in range(cols):
+            k = 0
+            for dr, dc in DIRECTIONS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and not occupancy[nr, nc]:
+                    neighbors[r * cols + c, k] = nr * cols + nc
+                    costs[r * cols + c, k] = 1.414 if (dr != 0 and dc != 0) else 1.0
+                    k += 1
+    return neighbors, costs
+
+
+# Cells are identified by their linear index r * COLS + c throughout the
+# searches; (r, c) pairs only appear at the display boundary. Cell sets such
+# as wall_bits are packed into an int with bit idx set for each member cell.
+def to_idx(r, c):
+    return r * COLS + c
+
+
+def to_rc(idx):
+    return divmod(idx, COLS)
+
+
+def build_occupancy(walls):
+    occupancy = np.zeros((ROWS, COLS), np.int8)
+    for r, c in walls:
+        occupancy[r, c] = 1
+    return occupancy
+
+
+# The walls are fixed, so the static layout's occupancy grid and neighbour
+# table are built once at import and shared by every grid and every search.
+STATIC_OCCUPANCY = build_occupancy(STATIC_WALLS)
+STATIC_WALL_BITS = sum(1 << to_idx(r, c) for r, c in STATIC_WALLS)
+NEIGHBORS, NEIGHBOR_COSTS = build_neighbor_table(STATIC_OCCUPANCY)
 
 
-def get_neighbors(grid, pos):
-    """Return valid neighbours in the mandatory clockwise order."""
-    r, c = pos
-    result = []
-    for dr, dc in DIRECTIONS:
-        nbr = (r + dr, c + dc)
-        if is_valid(grid, nbr):
-            cost = 1.414 if (dr != 0 and dc != 0) else 1.0
-            result.append((nbr, cost))
-    return result
+# ── Search Traces ──────────────────────────────────────────────────────────────
+# The search kernels below are compiled with numba and work on linear cell
+# indices (r * cols + c) over the precomputed neighbour table. Instead of building
+# snapshots they log a flat trace of events, which iter_steps() turns back
+# into visualizer steps on the Python side, one step at a time.
+EV_STEP  = 0    # node popped from the frontier (starts a new step)
+EV_PUSH  = 1    # node added to the frontier
+EV_VISIT = 2    # node marked visited
 
 
-# ── Step Recording ─────────────────────────────────────────────────────────────
-def make_step(current, frontier, visited):
+@njit(cache=True)
+def new_trace(n_cells):
+    # Every cell is visited at most once and expanded into at most
+    # len(DIRECTIONS) pushes, each of which is popped at most once.
+    cap = (2 * len(DIRECTIONS) + 2) * n_cells + 4
+    return np.empty(cap, np.int8), np.empty(cap, np.int32)
+
+
+@njit(cache=True)
+def log_event(kinds, nodes, n, kind, node):
+    kinds[n] = kind
+    nodes[n] = node
+    return n + 1
+
+
+# A step only records what changed since the previous step; the visualizer
+# applies these deltas in order to rebuild the frontier and visited sets.
+def make_step(current, added, removed, visited):
     return {
-        'current':  current,
-        'frontier': list(frontier),
-        'visited':  visited.copy(),
+        'current': current,
+        'added':   added,       # cells that joined the frontier
+        'removed': removed,     # cells that left the frontier
+        'visited': visited,     # cells newly marked visited
     }
 
 
-def reconstruct_path(came_from, goal):
-    path, node = [goal], goal
-    while came_from.get(node) is not None:
-        node = came_from[node]
+def iter_steps(kinds, nodes):
+    """Yield the per-step frontier / visited deltas of a kernel trace."""
+    frontier     = {}           # node -> number of copies on the frontier
+    visited_bits = 0
+    added, removed, visited = [], [], []
+
+    for kind, node in zip(kinds.tolist(), nodes.tolist()):
+        if kind == EV_PUSH:
+            if node not in frontier:
+                frontier[node] = 0
+                added.append(node)
+            frontier[node] += 1
+        elif kind == EV_VISIT:
+            if not (visited_bits >> node) & 1:
+                visited_bits |= 1 << node
+                visited.append(node)
+        else:
+            frontier[node] -= 1
+            if not frontier[node]:
+                del frontier[node]
+                removed.append(node)
+            yield make_step(node, added, removed, visited)
+            added, removed, visited = [], [], []
+
+
+def count_steps(kinds, nodes):
+    return int(np.count_nonzero(kinds == EV_STEP))
+
+
+def count_visited(kinds, nodes):
+    return len(np.unique(nodes[kinds == EV_VISIT]))
+
+
+def reconstruct_path(parent, goal):
+    path, node = [], int(goal)
+    while node >= 0:
         path.append(node)
+        node = int(parent[node])
     path.reverse()
     return path
 
 
 # ── 1. Breadth-First Search ────────────────────────────────────────────────────
-def bfs(grid):
-    queue    = deque([grid['start']])
-    in_queue = {grid['start']}
-    came_from = {grid['start']: None}
-    visited  = set()
-    steps    = []
+@njit(cache=True)
+def bfs_kernel(neighbors, start, goal):
+    n_cells = neighbors.shape[0]
+    parent  = np.full(n_cells, -1, np.int32)
+    visited = np.zeros(n_cells, np.bool_)        # marked when enqueued
+    queue   = np.empty(n_cells, np.int32)        # so a cell is enqueued once
+    kinds, nodes = new_trace(n_cells)
+
+    queue[0] = start
+    head, tail = 0, 1
+    visited[start] = True
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        n = log_event(kinds, nodes, n, EV_STEP, current)
+
+        if current == goal:                 # only when start == goal
+            return parent, kinds[:n], nodes[:n], current
+
+        # The trace still reports cells as explored when they are expanded.
+        n = log_event(kinds, nodes, n, EV_VISIT, current)
+
+        for nbr in neighbors[current]:
+            if nbr < 0:
+                break
+            if not visited[nbr]:
+                visited[nbr] = True
+                queue[tail] = nbr
+                tail += 1
+                parent[nbr] = current
+                n = log_event(kinds, nodes, n, EV_PUSH, nbr)
+                # The first time the goal is discovered is already via a
+                # shortest path, so stop here instead of a whole layer later.
+                if nbr == goal:
+                    n = log_event(kinds, nodes, n, EV_STEP, nbr)
+                    return parent, kinds[:n], nodes[:n], nbr
+
+    return parent, kinds[:n], nodes[:n], -1
 
-    while queue:
-        current = queue.popleft()
-        in_queue.discard(current)
-        steps.append(make_step(current, queue, visited))
 
-        if current == grid['goal']:
-            return steps, reconstruct_path(came_from, current)
+def bfs(grid):
+    parent, kinds, nodes, found = bfs_kernel(
+        grid['neighbors'], to_idx(*grid['start']), to_idx(*grid['goal']))
+    path = reconstruct_path(parent, found) if found >= 0 else []
+    return (kinds, nodes), path
+
+
+# A whole 10 × 10 cell set fits in one int (bit idx per cell, like wall_bits),
+# so a BFS layer can be expanded for every cell at once: each move is a single
+# shift by dr * COLS + dc, masked so that horizontal moves don't wrap rows.
+LEFT_COL_MASK  = sum(1 << (r * COLS) for r in range(ROWS))
+RIGHT_COL_MASK = LEFT_COL_MASK << (COLS - 1)
+BOARD_MASK     = (1 << (ROWS * COLS)) - 1
+
+
+def shift_cells(bits, dr, dc):
+    """Move every cell in the set `bits` by (dr, dc), dropping off-grid ones."""
+    delta = dr * COLS + dc
+    bits = (bits << delta) & BOARD_MASK if delta > 0 else bits >> -delta
+    if dc > 0:
+        bits &= ~LEFT_COL_MASK          # wrapped in from the previous row
+    elif dc < 0:
+        bits &= ~RIGHT_COL_MASK         # wrapped in from the next row
+    return bits
+
+
+def bfs_bitboard(grid):
+    """Shortest path (fewest moves) from start to goal, one layer at a time.
+
+    Only the path is returned; there is no per-node trace to animate.
+    """
+    start, goal = to_idx(*grid['start']), to_idx(*grid['goal'])
+    goal_bit = 1 << goal
+    via      = np.full(grid['rows'] * grid['cols'], -1, np.int8)
+    blocked  = grid['wall_bits'] | 1 << start
+    layer    = 1 << start
+
+    while layer and not blocked & goal_bit:
+        next_layer = 0
+        for d, (dr, dc) in enumerate(DIRECTIONS):
+            fresh = shift_cells(layer, dr, dc) & ~blocked & ~next_layer
+            next_layer |= fresh
+            while fresh:                # record the move that reached each cell
+                low = fresh & -fresh
+                via[low.bit_length() - 1] = d
+                fresh ^= low
+        blocked |= next_layer
+        layer = next_layer
+
+    if not blocked & goal_bit:
+        return []
+    path, node = [goal], goal
+    while node != start:
+        dr, dc = DIRECTIONS[via[node]]
+        node -= dr * COLS + dc
+        path.append(node)
+    path.reverse()
+    return path
+
 
-        if current in visited:
+# ── 2. Depth-First Search ──────────────────────────────────────────────────────
+@njit(cache=True)
+def dfs_kernel(neighbors, start, goal):
+    n_cells = neighbors.shape[0]
+    parent  = np.full(n_cells, -1, np.int32)
+    visited = np.zeros(n_cells, np.bool_)
+    stack   = np.empty(neighbors.size + 1, np.int32)
+    kinds, nodes = new_trace(n_cells)
+
+    stack[0] = start
+    top = 1
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+
+    while top > 0:
+        top -= 1
+        current = stack[top]
+        n = log_event(kinds, nodes, n, EV_STEP, current)
+
+        if current == goal:
+            return parent, kinds[:n], nodes[:n], current
+
+        if visited[current]:
             continue
-        visited.add(current)
+        visited[current] = True
+        n = log_event(kinds, nodes, n, EV_VISIT, current)
 
-        for nbr, _ in get_neighbors(grid, current):
-            if nbr not in visited and nbr not in in_queue:
-                queue.append(nbr)
-                in_queue.add(nbr)
-                came_from[nbr] = current
+        # Push in reverse so the first direction is popped first.
+        for nbr in neighbors[current][::-1]:
+            if nbr >= 0 and not visited[nbr]:
+                stack[top] = nbr
+                top += 1
+                n = log_event(kinds, nodes, n, EV_PUSH, nbr)
+                if parent[nbr] < 0 and nbr != start:
+                    parent[nbr] = current
 
-    return steps, []
+    return parent, kinds[:n], nodes[:n], -1
 
 
-# ── 2. Depth-First Search ──────────────────────────────────────────────────────
 def dfs(grid):
-    stack     = [grid['start']]
-    came_from = {grid['start']: None}
-    visited   = set()
-    steps     = []
-
-    while stack:
-        current = stack.pop()
-        steps.append(make_step(current, stack, visited))
-
-        if current == grid['goal']:
-            return steps, reconstruct_path(came_from, current)
-
-        if current in visited:
-            continue
-        visited.add(current)
+    parent, kinds, nodes, found = dfs_kernel(
+        grid['neighbors'], to_idx(*grid['start']), to_idx(*grid['goal']))
+    path = reconstruct_path(parent, found) if found >= 0 else []
+    return (kinds, nodes), path
 
-        for nbr, _ in reversed(get_neighbors(grid, current)):
-            if nbr not in visited:
-                stack.append(nbr)
-                if nbr not in came_from:
-                    came_from[nbr] = current
 
-    return steps, []
+# ── 3. Uniform Cost Search ─────────────────────────────────────────────────────
+# heapq is not available in nopython mode, so UCS runs its own indexed binary
+# heap over three parallel arrays ordered by (cost, insertion counter). pos maps
+# each node to its heap slot (-1 = not queued), so a cheaper path lowers the
+# node's key in place and every node sits in the heap at most once.
+@njit(cache=True)
+def heap_less(costs, counters, i, j):
+    if costs[i] != costs[j]:
+        return costs[i] < costs[j]
+    return counters[i] < counters[j]
+
+
+@njit(cache=True)
+def heap_swap(costs, counters, heap_nodes, pos, i, j):
+    costs[i], costs[j] = costs[j], costs[i]
+    counters[i], counters[j] = counters[j], counters[i]
+    heap_nodes[i], heap_nodes[j] = heap_nodes[j], heap_nodes[i]
+    pos[heap_nodes[i]] = i
+    pos[heap_nodes[j]] = j
+
+
+@njit(cache=True)
+def heap_sift_up(costs, counters, heap_nodes, pos, i):
+    while i > 0:
+        up = (i - 1) // 2
+        if not heap_less(costs, counters, i, up):
+            break
+        heap_swap(costs, counters, heap_nodes, pos, i, up)
+        i = up
 
 
-# ── 3. Uniform Cost Search ─────────────────────────────────────────────────────
-def ucs(grid):
-    counter      = 0
-    heap         = [(0, counter, grid['start'])]
-    came_from    = {grid['start']: None}
-    cost_so_far  = {grid['start']: 0}
-    visited      = set()
-    steps        = []
+@njit(cache=True)
+def heap_push(costs, counters, heap_nodes, pos, size, cost, counter, node):
+    costs[size], counters[size], heap_nodes[size] = cost, counter, node
+    pos[node] = size
+    heap_sift_up(costs, counters, heap_nodes, pos, size)
+    return size + 1
 
-    while heap:
-        cur_cost, _, current = heapq.heappop(heap)
-        steps.append(make_step(current, [i[2] for i in heap], visited))
 
-        if current == grid['goal']:
-            return steps, reconstruct_path(came_from, current)
+@njit(cache=True)
+def heap_decrease_key(costs, counters, heap_nodes, pos, node, cost, counter):
+    i = pos[node]
+    costs[i], counters[i] = cost, counter
+    heap_sift_up(costs, counters, heap_nodes, pos, i)
 
-        if current in visited:
-            continue
-        visited.add(current)
 
-        for nbr, edge_cost in get_neighbors(grid, current):
-            new_cost = cur_cost + edge_cost
-            if nbr not in cost_so_far or new_cost < cost_so_far[nbr]:
+@njit(cache=True)
+def heap_pop(costs, counters, heap_nodes, pos, size):
+    cost, node = costs[0], heap_nodes[0]
+    size -= 1
+    heap_swap(costs, counters, heap_nodes, pos, 0, size)
+    pos[node] = -1
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_less(costs, counters, child + 1, child):
+            child += 1
+        if not heap_less(costs, counters, child, i):
+            break
+        heap_swap(costs, counters, heap_nodes, pos, i, child)
+        i = child
+    return cost, node, size
+
+
+@njit(cache=True)
+def ucs_kernel(neighbors, neighbor_costs, start, goal):
+    n_cells     = neighbors.shape[0]
+    parent      = np.full(n_cells, -1, np.int32)
+    cost_so_far = np.full(n_cells, np.inf)
+    pos         = np.full(n_cells, -1, np.int32)
+    costs       = np.empty(n_cells, np.float64)
+    counters    = np.empty(n_cells, np.int64)
+    heap_nodes  = np.empty(n_cells, np.int32)
+    kinds, nodes = new_trace(n_cells)
+
+    counter = 0
+    size = heap_push(costs, counters, heap_nodes, pos, 0, 0.0, counter, start)
+    cost_so_far[start] = 0.0
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+
+    # With decrease-key there are no stale entries: every pop is a node's
+    # final, cheapest cost, so it is expanded straight away.
+    while size > 0:
+        cur_cost, current, size = heap_pop(costs, counters, heap_nodes, pos,
+                                           size)
+        n = log_event(kinds, nodes, n, EV_STEP, current)
+
+        if current == goal:
+            return parent, kinds[:n], nodes[:n], current
+
+        n = log_event(kinds, nodes, n, EV_VISIT, current)
+
+        for k in range(neighbors.shape[1]):
+            nbr = neighbors[current, k]
+            if nbr < 0:
+                break
+            new_cost = cur_cost + neighbor_costs[current, k]
+            if new_cost < cost_so_far[nbr]:
                 cost_so_far[nbr] = new_cost
                 counter += 1
-                heapq.heappush(heap, (new_cost, counter, nbr))
-                came_from[nbr] = current
+                parent[nbr] = current
+                if pos[nbr] >= 0:
+                    heap_decrease_key(costs, counters, heap_nodes, pos,
+                                      nbr, new_cost, counter)
+                else:
+                    size = heap_push(costs, counters, heap_nodes, pos, size,
+                                     new_cost, counter, nbr)
+                    n = log_event(kinds, nodes, n, EV_PUSH, nbr)
 
-    return steps, []
+    return parent, kinds[:n], nodes[:n], -1
 
 
-# ── 4. Depth-Limited Search ────────────────────────────────────────────────────
-def dls(grid, limit=15):
-    stack     = [(grid['start'], 0)]
-    came_from = {grid['start']: None}
-    visited   = set()
-    steps     = []
-
-    while stack:
-        current, depth = stack.pop()
-        steps.append(make_step(current, [i[0] for i in stack], visited))
+def ucs(grid):
+    parent, kinds, nodes, found = ucs_kernel(
+        grid['neighbors'], grid['neighbor_costs'],
+        to_idx(*grid['start']), to_idx(*grid['goal']))
+    path = reconstruct_path(parent, found) if found >= 0 else []
+    return (kinds, nodes), path
 
-        if current == grid['goal']:
-            return steps, reconstruct_path(came_from, current)
 
-        if current in visited or depth >= limit:
+# ── 4. Depth-Limited Search ────────────────────────────────────────────────────
+@njit(cache=True)
+def dls_kernel(neighbors, start, goal, limit):
+    n_cells = neighbors.shape[0]
+    parent  = np.full(n_cells, -1, np.int32)
+    visited = np.zeros(n_cells, np.bool_)
+    stack   = np.empty(neighbors.size + 1, np.int32)
+    depths  = np.empty(neighbors.size + 1, np.int32)
+    kinds, nodes = new_trace(n_cells)
+
+    stack[0], depths[0] = start, 0
+    top = 1
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+
+    while top > 0:
+        top -= 1
+        current, depth = stack[top], depths[top]
+        n = log_event(kinds, nodes, n, EV_STEP, current)
+
+        if current == goal:
+            return parent, kinds[:n], nodes[:n], current
+
+        if visited[current] or depth >= limit:
             continue
-        visited.add(current)
+        visited[current] = True
+        n = log_event(kinds, nodes, n, EV_VISIT, current)
+
+        for nbr in neighbors[current][::-1]:
+            if nbr >= 0 and not visited[nbr]:
+                stack[top], depths[top] = nbr, depth + 1
+                top += 1
+                n = log_event(kinds, nodes, n, EV_PUSH, nbr)
+                if parent[nbr] < 0 and nbr != start:
+                    parent[nbr] = current
+
+    return parent, kinds[:n], nodes[:n], -1
 
-        for nbr, _ in reversed(get_neighbors(grid, current)):
-            if nbr not in visited:
-                stack.append((nbr, depth + 1))
-                if nbr not in came_from:
-                    came_from[nbr] = current
 
-    return steps, []
+def dls(grid, limit=15):
+    parent, kinds, nodes, found = dls_kernel(
+        grid['neighbors'],
+        to_idx(*grid['start']), to_idx(*grid['goal']), limit)
+    path = reconstruct_path(parent, found) if found >= 0 else []
+    return (kinds, nodes), path
 
 
 # ── 5. Iterative Deepening DFS ─────────────────────────────────────────────────
+# Re-running DLS from scratch for every depth limit repeats all of the
+# shallower work each time. Instead the kernel remembers the shallowest depth
+# each node was reached at, and each deeper iteration only expands the nodes
+# that sat exactly on the previous limit.
+@njit(cache=True)
+def iddfs_kernel(neighbors, start, goal):
+    n_cells  = neighbors.shape[0]
+    parent   = np.full(n_cells, -1, np.int32)
+    depth    = np.full(n_cells, n_cells, np.int32)
+    frontier = np.empty(n_cells, np.int32)      # nodes on the current limit
+    deeper   = np.empty(n_cells, np.int32)      # nodes for the next limit
+    kinds, nodes = new_trace(n_cells)
+
+    frontier[0] = start
+    size = 1
+    depth[start] = 0
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+
+    while size > 0:
+        next_size = 0
+        while size > 0:
+            size -= 1
+            current = frontier[size]
+            n = log_event(kinds, nodes, n, EV_STEP, current)
+
+            if current == goal:
+                return parent, kinds[:n], nodes[:n], current
+
+            n = log_event(kinds, nodes, n, EV_VISIT, current)
+
+            for nbr in neighbors[current][::-1]:
+                if nbr >= 0 and depth[current] + 1 < depth[nbr]:
+                    depth[nbr] = depth[current] + 1
+                    parent[nbr] = current
+                    deeper[next_size] = nbr
+                    next_size += 1
+                    n = log_event(kinds, nodes, n, EV_PUSH, nbr)
+
+        frontier, deeper = deeper, frontier
+        size = next_size
+
+    return parent, kinds[:n], nodes[:n], -1
+
+
 def iddfs(grid):
-    all_steps = []
-    for depth_limit in range(ROWS * COLS):
-        steps, path = dls(grid, depth_limit)
-        all_steps.extend(steps)
-        if path:
-            return all_steps, path
-    return all_steps, []
+    parent, kinds, nodes, found = iddfs_kernel(
+        grid['neighbors'], to_idx(*grid['start']), to_idx(*grid['goal']))
+    path = reconstruct_path(parent, found) if found >= 0 else []
+    return (kinds, nodes), path
 
 
 # ── 6. Bidirectional Search ────────────────────────────────────────────────────
 def merge_paths(fwd_parent, bwd_parent, meeting):
     """Stitch forward and backward halves into a single path."""
-    path_fwd, node = [], meeting
-    while node is not None:
-        path_fwd.append(node)
-        node = fwd_parent.get(node)
-    path_fwd.reverse()
-
-    path_bwd, node = [], bwd_parent.get(meeting)
-    while node is not None:
+    path_fwd = reconstruct_path(fwd_parent, meeting)
+
+    path_bwd, node = [], int(bwd_parent[meeting])
+    while node >= 0:
         path_bwd.append(node)
-        node = bwd_parent.get(node)
+        node = int(bwd_parent[node])
 
     return path_fwd + path_bwd
 
 
+@njit(cache=True)
+def expand_side(neighbors, queue, head, tail, visited, parent, other_visited,
+                kinds, nodes, n):
+    """Pop and expand one node of a single search direction."""
+    current = queue[head]
+    head += 1
+    n = log_event(kinds, nodes, n, EV_STEP, current)
+    if other_visited[current]:
+        return head, tail, n, current
+    for nbr in neighbors[current]:
+        if nbr < 0:
+            break
+        if not visited[nbr]:
+            queue[tail] = nbr
+            tail += 1
+            visited[nbr] = True
+            parent[nbr] = current
+            n = log_event(kinds, nodes, n, EV_PUSH, nbr)
+            n = log_event(kinds, nodes, n, EV_VISIT, nbr)
+    return head, tail, n, -1
+
+
+@njit(cache=True)
+def bidirectional_kernel(neighbors, start, goal):
+    n_cells     = neighbors.shape[0]
+    fwd_parent  = np.full(n_cells, -1, np.int32)
+    bwd_parent  = np.full(n_cells, -1, np.int32)
+    fwd_visited = np.zeros(n_cells, np.bool_)
+    bwd_visited = np.zeros(n_cells, np.bool_)
+    fwd_queue   = np.empty(n_cells, np.int32)
+    bwd_queue   = np.empty(n_cells, np.int32)
+    kinds, nodes = new_trace(n_cells)
+
+    fwd_queue[0], bwd_queue[0] = start, goal
+    fwd_head, fwd_tail, bwd_head, bwd_tail = 0, 1, 0, 1
+    fwd_visited[start] = True
+    bwd_visited[goal] = True
+    n = log_event(kinds, nodes, 0, EV_PUSH, start)
+    n = log_event(kinds, nodes, n, EV_PUSH, goal)
+    n = log_event(kinds, nodes, n, EV_VISIT, start)
+    n = log_event(kinds, nodes, n, EV_VISIT, goal)
+
+    while fwd_head < fwd_tail or bwd_head < bwd_tail:
+        # Grow whichever search currently has the smaller frontier.
+        fwd_size, bwd_size = fwd_tail - fwd_head, bwd_tail - bwd_head
+        if bwd_size == 0 or 0 < fwd_size <= bwd_size:
+            fwd_head, fwd_tail, n, meeting = expand_side(
+                neighbors, fwd_queue, fwd_head, fwd_tail, fwd_visited,
+                fwd_parent, bwd_visited, kinds, nodes, n)
+        else:
+            bwd_head, bwd_tail, n, meeting = expand_side(
+                neighbors, bwd_queue, bwd_head, bwd_tail, bwd_visited,
+                bwd_parent, fwd_visited, kinds, nodes, n)
+        if meeting >= 0:
+            return fwd_parent, bwd_parent, kinds[:n], nodes[:n], meeting
+
+    return fwd_parent, bwd_parent, kinds[:n], nodes[:n], -1
+
+
 def bidirectional(grid):
-    fwd_queue  = deque([grid['start']])
-    fwd_visited = {grid['start']}
-    fwd_parent  = {grid['start']: None}
-
-    bwd_queue  = deque([grid['goal']])
-    bwd_visited = {grid['goal']}
-    bwd_parent  = {grid['goal']: None}
-
-    steps = []
-
-    while fwd_queue or bwd_queue:
-        if fwd_queue:
-            cur_f = fwd_queue.popleft()
-            steps.append(make_step(cur_f,
-                                   list(fwd_queue) + list(bwd_queue),
-                                   fwd_visited | bwd_visited))
-            if cur_f in bwd_visited:
-                return steps, merge_paths(fwd_parent, bwd_parent, cur_f)
-            for nbr, _ in get_neighbors(grid, cur_f):
-                if nbr not in fwd_visited:
-                    fwd_queue.append(nbr)
-                    fwd_visited.add(nbr)
-                    fwd_parent[nbr] = cur_f
-
-        if bwd_queue:
-            cur_b = bwd_queue.popleft()
-            steps.append(make_step(cur_b,
-                                   list(fwd_queue) + list(bwd_queue),
-                                   fwd_visited | bwd_visited))
-            if cur_b in fwd_visited:
-                return steps, merge_paths(fwd_parent, bwd_parent, cur_b)
-            for nbr, _ in get_neighbors(grid, cur_b):
-                if nbr not in bwd_visited:
-                    bwd_queue.append(nbr)
-                    bwd_visited.add(nbr)
-                    bwd_parent[nbr] = cur_b
-
-    return steps, []
+    fwd_parent, bwd_parent, kinds, nodes, meeting = bidirectional_kernel(
+        grid['neighbors'], to_idx(*grid['start']), to_idx(*grid['goal']))
+    path = merge_paths(fwd_parent, bwd_parent, meeting) if meeting >= 0 else []
+    return (kinds, nodes), path
+
+
+# ── Precompiled Kernels ────────────────────────────────────────────────────────
+# `python build_kernels.py` compiles the kernels above ahead of time into the
+# pathfinder_kernels extension module. When it has been built, use it so no
+# JIT compilation happens at startup; otherwise keep the @njit versions.
+# The module records a hash of the kernel sources it was built from and is
+# ignored (with a warning to rebuild it) once the kernels here have changed.
+def kernel_source_hash():
+    """Hash of every @njit function and the constants compiled into them."""
+    with open(__file__, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    digest = hashlib.sha256()
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and any(
+                isinstance(d, ast.Call) and getattr(d.func, 'id', None) == 'njit'
+                or getattr(d, 'id', None) == 'njit'
+                for d in node.decorator_list):
+            digest.update(ast.dump(node).encode())
+    digest.update(repr((DIRECTIONS, EV_STEP, EV_PUSH, EV_VISIT)).encode())
+    return int.from_bytes(digest.digest()[:8], 'little', signed=True)
+
+
+try:
+    import pathfinder_kernels
+except ImportError:
+    pathfinder_kernels = None
+
+if pathfinder_kernels is not None:
+    built_from = getattr(pathfinder_kernels, 'source_hash', lambda: None)()
+    if built_from == kernel_source_hash():
+        from pathfinder_kernels import (bfs_kernel, dfs_kernel, ucs_kernel,
+                                        dls_kernel, iddfs_kernel,
+                                        bidirectional_kernel)
+    else:
+        warnings.warn('pathfinder_kernels was built from older kernel sources '
+                      'and is ignored; rerun build_kernels.py to update it.')
 
 
 # ── Drawing Utilities ──────────────────────────────────────────────────────────
-def draw_cell(ax, r, c, facecolor, label='', label_color='white', fontsize=11):
-    ax.add_patch(patches.Rectangle(
-        (c - 0.45, r - 0.45), 0.9, 0.9,
-        facecolor=facecolor, edgecolor=facecolor, linewidth=0, zorder=2))
-    if label:
-        ax.text(c, r, label, ha='center', va='center',
-                fontsize=fontsize, fontweight='bold', color=label_color, zorder=3)
+def draw_label(ax, r, c, label, label_color='white', fontsize=11):
+    ax.text(c, r, label, ha='center', va='center',
+            fontsize=fontsize, fontweight='bold', color=label_color, zorder=3)
 
 
 def draw_legend(ax):
@@ -312,42 +709,74 @@ def draw_legend(ax):
             bbox=dict(facecolor='#2D2D2D', edgecolor='#555', pad=3))
 
 
-def draw_stats(ax, algo_name, frame, steps, path, visited, frontier):
-    ax.clear()
+def draw_stats(ax, algo_name):
+    """Draw the static stats labels; returns the value texts to update."""
     ax.set_facecolor('#1A1A1A')
     ax.axis('off')
     ax.text(0.5, 0.97, 'STATISTICS', ha='center', va='top',
             fontsize=12, fontweight='bold', color='white',
             transform=ax.transAxes)
 
-    search_done = frame >= len(steps)
+    labels = ['Algorithm:', 'Step:', 'Nodes explored:', 'Frontier size:',
+              'Path found:', 'Path length:']
+    values = []
+    y = 0.84
+    for label in labels:
+        ax.text(0.04, y, label, ha='left', va='center',
+                fontsize=9, fontweight='bold', color='#BBBBBB',
+                transform=ax.transAxes)
+        values.append(ax.text(0.98, y, '', ha='right', va='center',
+                              fontsize=9, fontweight='bold',
+                              transform=ax.transAxes))
+        y -= 0.115
+    values[0].set_text(algo_name)
+    return values
+
+
+def update_stats(values, frame, n_steps, path, visited, frontier):
+    search_done = frame >= n_steps
     path_status = ('YES  ✔' if (search_done and path) else
                    'NO  ✖'  if (search_done and not path) else
                    'Searching…')
 
-    rows_data = [
-        ('Algorithm:',      algo_name),
-        ('Step:',           f"{min(frame + 1, len(steps))} / {len(steps)}"),
-        ('Nodes explored:', str(len(visited))),
-        ('Frontier size:',  str(len(frontier))),
-        ('Path found:',     path_status),
-        ('Path length:',    str(len(path)) if (search_done and path) else '—'),
+    vals = [
+        values[0].get_text(),
+        f"{min(frame + 1, n_steps)} / {n_steps}",
+        str(len(visited)),
+        str(len(frontier)),
+        path_status,
+        str(len(path)) if (search_done and path) else '—',
     ]
-    y = 0.84
-    for label, val in rows_data:
-        ax.text(0.04, y, label, ha='left', va='center',
-                fontsize=9, fontweight='bold', color='#BBBBBB',
-                transform=ax.transAxes)
+    for text, val in zip(values, vals):
         val_color = ('#69F0AE' if 'YES' in val else
                      '#FF5252' if 'NO'  in val else '#82B1FF')
-        ax.text(0.98, y, val, ha='right', va='center',
-                fontsize=9, fontweight='bold', color=val_color,
-                transform=ax.transAxes)
-        y -= 0.115
+        text.set_text(val)
+        text.set_color(val_color)
 
 
 # ── Main Visualizer ────────────────────────────────────────────────────────────
-def visualize(grid, algo_name, steps, path):
+# Label colour and font size of each dynamic cell state.
+CELL_STYLES = {
+    'path':     ('#212121', 9),
+    'frontier': ('#212121', 9),
+    'visited':  ('#424242', 14),
+}
+
+# Cell colours are drawn as meshes of colour indices: one for the static
+# wall / start / goal cells and one for the dynamic states. Index 0 is
+# transparent so the background shows through empty cells and the gaps
+# between them.
+CELL_CODES = {'visited': 1, 'frontier': 2, 'path': 3,
+              'wall': 4, 'start': 5, 'goal': 6}
+CELL_CMAP  = ListedColormap(['none'] + [COLORS[kind] for kind in CELL_CODES])
+
+
+def inset_edges(n):
+    """Mesh edges giving n 0.9-wide cells centred on 0..n-1 with gaps between."""
+    return np.ravel([(i - 0.45, i + 0.45) for i in range(n)])
+
+
+def visualize(grid, algo_name, trace, path):
     fig = plt.figure(figsize=(15, 9))
     fig.patch.set_facecolor('#212121')
     fig.canvas.manager.set_window_title('AI Pathfinder – Blind Search Visualizer')
@@ -356,80 +785,158 @@ def visualize(grid, algo_name, steps, path):
     ax_legend = plt.subplot2grid((10, 13), (0, 9), colspan=4, rowspan=5)
     ax_stats  = plt.subplot2grid((10, 13), (5, 9), colspan=4, rowspan=5)
 
-    def update(frame):
-        ax_main.clear()
-        ax_main.set_xlim(-0.5, grid['cols'] - 0.5)
-        ax_main.set_ylim(-0.5, grid['rows'] - 0.5)
-        ax_main.set_aspect('equal')
-        ax_main.invert_yaxis()
-        ax_main.set_facecolor('#2D2D2D')
-        ax_main.set_xticks([])
-        ax_main.set_yticks([])
-
-        search_done = frame >= len(steps)
-        suffix = ('  ✔ DONE'    if (search_done and path)  else
-                  '  ✖ NO PATH' if (search_done and not path) else
-                  '  searching…')
-        ax_main.set_title(
-            f'{algo_name}{suffix}',
-            fontsize=18, fontweight='bold', pad=10, color='white',
-            bbox=dict(facecolor='#1A1A1A', edgecolor='none', pad=5))
-
-        if frame < len(steps):
-            st       = steps[frame]
-            current  = st['current']
-            frontier = set(st['frontier'])
-            visited  = st['visited']
-            curr_path = []
+    ax_main.set_xlim(-0.5, grid['cols'] - 0.5)
+    ax_main.set_ylim(-0.5, grid['rows'] - 0.5)
+    ax_main.set_aspect('equal')
+    ax_main.invert_yaxis()
+    ax_main.set_facecolor('#2D2D2D')
+    ax_main.set_xticks([])
+    ax_main.set_yticks([])
+    ax_main.set_title(
+        f'{algo_name}  searching…',
+        fontsize=18, fontweight='bold', pad=10, color='white',
+        bbox=dict(facecolor='#1A1A1A', edgecolor='none', pad=5))
+
+    # Everything is created once. Walls, start and goal never change and go
+    # into static_codes; every other cell gets a colour index in cell_codes
+    # and a label that update() restyles in place, so blitting only has to
+    # redraw these artists.
+    mesh_shape   = (2 * grid['rows'] - 1, 2 * grid['cols'] - 1)
+    static_codes = np.zeros(mesh_shape, np.int8)
+    mesh_codes   = np.zeros(mesh_shape, np.int8)
+    cell_codes   = mesh_codes[::2, ::2]     # cells; odd rows/cols are gaps
+    cell_texts, cell_state = {}, {}
+    for r in range(grid['rows']):
+        for c in range(grid['cols']):
+            pos, idx = (r, c), to_idx(r, c)
+
+            if (grid['wall_bits'] >> idx) & 1:
+                static_codes[2 * r, 2 * c] = CELL_CODES['wall']
+                draw_label(ax_main, r, c, '■', label_color='#78909C', fontsize=12)
+            elif pos == grid['start']:
+                static_codes[2 * r, 2 * c] = CELL_CODES['start']
+                draw_label(ax_main, r, c, 'S', fontsize=13)
+            elif pos == grid['goal']:
+                static_codes[2 * r, 2 * c] = CELL_CODES['goal']
+                draw_label(ax_main, r, c, 'T', fontsize=13)
+            else:
+                cell_texts[idx] = ax_main.text(
+                    c, r, '', ha='center', va='center',
+                    fontweight='bold', zorder=3)
+                cell_state[idx] = None
+
+    # Background cells + grid lines, then the static cells on top.
+    ax_main.pcolormesh(
+        np.arange(grid['cols'] + 1) - 0.5, np.arange(grid['rows'] + 1) - 0.5,
+        np.zeros((grid['rows'], grid['cols'])), cmap=ListedColormap([COLORS['bg']]),
+        edgecolors=COLORS['grid'], linewidth=0.8, antialiased=True, zorder=1)
+    ax_main.pcolormesh(
+        inset_edges(grid['cols']), inset_edges(grid['rows']), static_codes,
+        cmap=CELL_CMAP, norm=NoNorm(), zorder=2)
+    cell_mesh = ax_main.pcolormesh(
+        inset_edges(grid['cols']), inset_edges(grid['rows']), mesh_codes,
+        cmap=CELL_CMAP, norm=NoNorm(), zorder=2)
+
+    # Highlight current node with a coloured border
+    highlight = ax_main.add_patch(patches.FancyBboxPatch(
+        (0, 0), 0.88, 0.88,
+        boxstyle='round,pad=0.02', facecolor='none',
+        edgecolor=COLORS['current'], linewidth=3, visible=False, zorder=4))
+
+    draw_legend(ax_legend)
+    stat_values = draw_stats(ax_stats, algo_name)
+
+    artists = [cell_mesh] + list(cell_texts.values()) + [highlight] + stat_values
+
+    # Running frontier / visited sets, built up by applying step deltas as
+    # the frames stream in.
+    n_steps = count_steps(*trace)
+    replay  = {'frontier': set(), 'visited': set()}
+
+    # Position of each cell along the final path, for O(1) lookups per cell.
+    path_index = {node: i for i, node in enumerate(path or [])}
+
+    def frames():
+        # Steps are decoded from the trace only as the animation reaches
+        # them; a final None frame shows the finished search.
+        yield from enumerate(iter_steps(*trace))
+        yield n_steps, None
+
+    def init():
+        return artists
+
+    def update(item):
+        frame, st = item
+        search_done = st is None
+
+        if st is not None:
+            replay['frontier'].update(st['added'])
+            replay['frontier'].difference_update(st['removed'])
+            replay['visited'].update(st['visited'])
+            current   = st['current']
+            frontier  = replay['frontier']
+            visited   = replay['visited']
+            curr_path = {}
         else:
             current   = None
             frontier  = set()
-            visited   = steps[-1]['visited'] if steps else set()
-            curr_path = path or []
-
-        for r in range(grid['rows']):
-            for c in range(grid['cols']):
-                pos = (r, c)
-
-                # Background cell + grid line
-                ax_main.add_patch(patches.Rectangle(
-                    (c - 0.5, r - 0.5), 1, 1,
-                    facecolor=COLORS['bg'], edgecolor=COLORS['grid'],
-                    linewidth=0.8, zorder=1))
-
-                # Priority rendering order
-                if pos in grid['walls']:
-                    draw_cell(ax_main, r, c, COLORS['wall'], '■',
-                              label_color='#78909C', fontsize=12)
-                elif pos == grid['start']:
-                    draw_cell(ax_main, r, c, COLORS['start'], 'S', fontsize=13)
-                elif pos == grid['goal']:
-                    draw_cell(ax_main, r, c, COLORS['goal'],  'T', fontsize=13)
-                elif pos in curr_path:
-                    idx   = curr_path.index(pos)
-                    label = str(idx) if 0 < idx < len(curr_path) - 1 else ''
-                    draw_cell(ax_main, r, c, COLORS['path'], label,
-                              label_color='#212121', fontsize=9)
-                elif pos in frontier:
-                    draw_cell(ax_main, r, c, COLORS['frontier'], 'F',
-                              label_color='#212121', fontsize=9)
-                elif pos in visited:
-                    draw_cell(ax_main, r, c, COLORS['visited'], '·',
-                              label_color='#424242', fontsize=14)
-
-                # Highlight current node with a coloured border
-                if pos == current:
-                    ax_main.add_patch(patches.FancyBboxPatch(
-                        (c - 0.44, r - 0.44), 0.88, 0.88,
-                        boxstyle='round,pad=0.02', facecolor='none',
-                        edgecolor=COLORS['current'], linewidth=3, zorder=4))
-
-        draw_legend(ax_legend)
-        draw_stats(ax_stats, algo_name, frame, steps, path, visited, frontier)
-
-    total_frames = len(steps) + 40          # extra frames to hold on final state
-    anim = FuncAnimation(fig, update, frames=total_frames,
-                         interval=180, repeat=False)
+            visited   = replay['visited']
+            curr_path = path_index
+
+        for idx, text in cell_texts.items():
+            # Priority rendering order
+            if idx in curr_path:
+                step  = curr_path[idx]
+                state = ('path', str(step) if 0 < step < len(curr_path) - 1 else '')
+            elif idx in frontier:
+                state = ('frontier', 'F')
+            elif idx in visited:
+                state = ('visited', '·')
+            else:
+                state = None
+
+            if state == cell_state[idx]:
+                continue
+            cell_state[idx] = state
+            if state is None:
+                cell_codes[to_rc(idx)] = 0
+                text.set_text('')
+                continue
+            kind, label = state
+            label_color, fontsize = CELL_STYLES[kind]
+            cell_codes[to_rc(idx)] = CELL_CODES[kind]
+            text.set_text(label)
+            text.set_color(label_color)
+            text.set_fontsize(fontsize)
+        cell_mesh.set_array(mesh_codes)
+
+        if current is not None:
+            r, c = to_rc(current)
+            highlight.set_x(c - 0.44)
+            highlight.set_y(r - 0.44)
+        highlight.set_visible(current is not None)
+
+        update_stats(stat_values, frame, n_steps, path, visited, frontier)
+        if not search_done:
+            return artists
+
+        # Last frame. The title sits outside the blitted axes area, so it
+        # needs a full redraw, which skips animated artists (and GUI backends
+        # run it after this frame's blit). Hand the artists back to normal
+        # drawing first, and return none, as FuncAnimation re-marks returned
+        # artists as animated.
+        suffix = '  ✔ DONE' if path else '  ✖ NO PATH'
+        ax_main.title.set_text(f'{algo_name}{suffix}')
+        for artist in artists:
+            artist.set_animated(False)
+        fig.canvas.draw_idle()
+        return []
+
+    # One frame per step plus a last one that draws the final path; with
+    # repeat=False the animation then stops and that frame stays on screen.
+    anim = FuncAnimation(fig, update, frames=frames, init_func=init,
+                         save_count=n_steps + 1, cache_frame_data=False,
+                         interval=180, repeat=False, blit=True)
     plt.tight_layout(pad=1.5)
     plt.show()
 
@@ -437,38 +944,38 @@ def visualize(grid, algo_name, steps, path):
 # ── Runner Functions ───────────────────────────────────────────────────────────
 def run_bfs():
     grid = build_grid()
-    steps, path = bfs(grid)
-    return grid, steps, path
+    trace, path = bfs(grid)
+    return grid, trace, path
 
 
 def run_dfs():
     grid = build_grid()
-    steps, path = dfs(grid)
-    return grid, steps, path
+    trace, path = dfs(grid)
+    return grid, trace, path
 
 
 def run_ucs():
     grid = build_grid()
-    steps, path = ucs(grid)
-    return grid, steps, path
+    trace, path = ucs(grid)
+    return grid, trace, path
 
 
 def run_dls():
     grid = build_grid()
-    steps, path = dls(grid, limit=15)
-    return grid, steps, path
+    trace, path = dls(grid, limit=15)
+    return grid, trace, path
 
 
 def run_iddfs():
     grid = build_grid()
-    steps, path = iddfs(grid)
-    return grid, steps, path
+    trace, path = iddfs(grid)
+    return grid, trace, path
 
 
 def run_bidirectional():
     grid = build_grid()
-    steps, path = bidirectional(grid)
-    return grid, steps, path
+    trace, path = bidirectional(grid)
+    return grid, trace, path
 
 
 # ── Algorithm Registry ─────────────────────────────────────────────────────────
@@ -510,27 +1017,28 @@ def main():
         short_name, long_name, run_fn = ALGO_MAP[choice]
         print(f'\n  Running  {long_name} ...')
 
-        grid, steps, path = run_fn()
+        grid, trace, path = run_fn()
 
-        nodes_visited = len(steps[-1]['visited']) if steps else 0
+        nodes_visited = count_visited(*trace)
 
         print('=' * 62)
         if path:
             print(f'  PATH FOUND!   Length: {len(path)} steps')
             print(f'  Nodes explored : {nodes_visited}')
-            print(f'  Static walls   : {len(grid["walls"])}')
+            print(f'  Shortest route : {len(bfs_bitboard(grid))} steps')
+            print(f'  Static walls   : {bin(grid["wall_bits"]).count("1")}')
             print(f'\n  Route:')
             for i, cell in enumerate(path):
                 tag = ' (Start)' if i == 0 else (' (Goal)' if i == len(path) - 1 else '')
-                print(f'    {i:3d}.  {cell}{tag}')
+                print(f'    {i:3d}.  {to_rc(cell)}{tag}')
         else:
             print('  NO PATH FOUND')
             print(f'  Nodes explored : {nodes_visited}')
-            print(f'  Static walls   : {len(grid["walls"])}')
+            print(f'  Static walls   : {bin(grid["wall_bits"]).count("1")}')
         print('=' * 62)
 
         print('\n  Opening animated visualization ...\n')
-        visualize(grid, short_name, steps, path)
+        visualize(grid, short_name, trace, path)
 
         again = input('\n  Run another algorithm? (y / n): ').strip().lower()
         if again not in ('y', 'yes'):
@@ -0,0 +1,53 @@
+"""Precompile the search kernels into the pathfinder_kernels extension module.
+
+Run once with numba installed:
+
+    python build_kernels.py
+
+ai_pathfinder.py picks the compiled module up automatically, so the kernels
+no longer have to be JIT-compiled when the program starts. Rerun it after
+editing any kernel: until then ai_pathfinder.py warns that the build is out
+of date and falls back to the @njit kernels.
+"""
+import os
+import sys
+
+from numba.pycc import CC
+
+# Compile from the @njit sources even if an older build is already present.
+sys.modules['pathfinder_kernels'] = None
+import ai_pathfinder as ap  # noqa: E402
+
+cc = CC('pathfinder_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# parent, kinds, nodes, found
+TRACE     = 'Tuple((i4[::1], i1[::1], i4[::1], i8))'
+BI_TRACE  = 'Tuple((i4[::1], i4[::1], i1[::1], i4[::1], i8))'
+NEIGHBORS = 'i4[:, ::1]'
+
+# Lets ai_pathfinder.py tell whether this build matches its current kernels.
+SOURCE_HASH = ap.kernel_source_hash()
+
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+
+cc.export('bfs_kernel', f'{TRACE}({NEIGHBORS}, i8, i8)')(
+    ap.bfs_kernel.py_func)
+cc.export('dfs_kernel', f'{TRACE}({NEIGHBORS}, i8, i8)')(
+    ap.dfs_kernel.py_func)
+cc.export('ucs_kernel', f'{TRACE}({NEIGHBORS}, f8[:, ::1], i8, i8)')(
+    ap.ucs_kernel.py_func)
+cc.export('dls_kernel', f'{TRACE}({NEIGHBORS}, i8, i8, i8)')(
+    ap.dls_kernel.py_func)
+cc.export('iddfs_kernel', f'{TRACE}({NEIGHBORS}, i8, i8)')(
+    ap.iddfs_kernel.py_func)
+cc.export('bidirectional_kernel', f'{BI_TRACE}({NEIGHBORS}, i8, i8)')(
+    ap.bidirectional_kernel.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()
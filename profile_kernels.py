@@ -0,0 +1,61 @@
+"""Time every search kernel on the static grid and on random wall layouts.
+
+    python profile_kernels.py [calls]
+
+Reports the mean time per kernel call, and whether the precompiled
+pathfinder_kernels module (see build_kernels.py) or the @njit / plain Python
+kernels are in use, so the two builds can be compared.
+"""
+import random
+import sys
+import time
+from types import BuiltinFunctionType
+
+import ai_pathfinder as ap
+
+
+def random_grids(count, seed=0):
+    """Yield (neighbors, neighbor_costs, start, goal) for random wall layouts."""
+    rng = random.Random(seed)
+    cells = [(r, c) for r in range(ap.ROWS) for c in range(ap.COLS)]
+    for _ in range(count):
+        walls = set(rng.sample(cells, len(ap.STATIC_WALLS)))
+        start, goal = rng.sample([cell for cell in cells if cell not in walls], 2)
+        neighbors, costs = ap.build_neighbor_table(ap.build_occupancy(walls))
+        yield neighbors, costs, ap.to_idx(*start), ap.to_idx(*goal)
+
+
+def kernel_calls(neighbors, costs, start, goal):
+    return {
+        'BFS':           lambda: ap.bfs_kernel(neighbors, start, goal),
+        'DFS':           lambda: ap.dfs_kernel(neighbors, start, goal),
+        'UCS':           lambda: ap.ucs_kernel(neighbors, costs, start, goal),
+        'DLS':           lambda: ap.dls_kernel(neighbors, start, goal, 15),
+        'IDDFS':         lambda: ap.iddfs_kernel(neighbors, start, goal),
+        'Bidirectional': lambda: ap.bidirectional_kernel(neighbors, start, goal),
+    }
+
+
+def main(calls=2000):
+    static = (ap.NEIGHBORS, ap.NEIGHBOR_COSTS,
+              ap.to_idx(*ap.START), ap.to_idx(*ap.GOAL))
+    grids = [static] + list(random_grids(19))
+    kind = ('precompiled' if isinstance(ap.bfs_kernel, BuiltinFunctionType) else
+            'numba JIT'   if hasattr(ap.bfs_kernel, 'py_func') else
+            'plain Python')
+
+    print(f'Kernels: {kind}   ({len(grids)} grids x {calls} calls)')
+    for name in kernel_calls(*static):
+        total = 0.0
+        for grid in grids:
+            call = kernel_calls(*grid)[name]
+            call()                          # compile / warm up outside the timing
+            t0 = time.perf_counter()
+            for _ in range(calls):
+                call()
+            total += time.perf_counter() - t0
+        print(f'  {name:14s} {total / (len(grids) * calls) * 1e6:8.2f} us/call')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))